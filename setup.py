@@ -10,17 +10,18 @@ except ImportError:
 import os
 from setuptools import setup, find_packages
 
-SOURCE = os.path.relpath(os.path.join(os.path.dirname(__file__), 'src'))
+HERE = os.path.dirname(__file__)
+SOURCE = os.path.relpath(os.path.join(HERE, 'src'))
+VERSION_PATTERN = re.compile("__version__ = '(.*)'")
 
 # Utility function to read the README, etc..
 # Used for the long_description and other fields.
 def read(fname):
-    with open(os.path.join(os.path.dirname(__file__), fname)) as f:
+    with open(os.path.join(HERE, fname)) as f:
         contents = f.read()
     return contents
 
-__version__ ,= re.findall("__version__ = '(.*)'",
-    read('src/haroslaunch/__init__.py'))
+__version__ ,= VERSION_PATTERN.findall(read('src/haroslaunch/__init__.py'))
 
 requirements = [r for r in read('requirements.txt').splitlines() if r]
 test_requirements = [r for r in read('test-requirements.txt').splitlines() if r]
@@ -54,6 +55,7 @@ setup(
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Topic :: Scientific/Engineering',
         'Topic :: Software Development',
         'Topic :: Software Development :: Interpreters',
@@ -210,12 +210,25 @@ class ConditionalData(object):
         return self._base
 
     def set(self, value, condition):
+        # mutates this object in place; kept for API compatibility,
+        # scopes use the copy-on-write `updated()` instead
         if condition.is_true:
             self._base = value
             self._variants = []
         elif not condition.is_false:
             self._variants.append((value, condition))
 
+    def updated(self, value, condition):
+        # like `set()`, but returns a new object and leaves this one as is;
+        # entries of a `VariantDict` are shared with its shallow copies
+        if condition.is_true:
+            return ConditionalData(value)
+        if condition.is_false:
+            return self
+        variants = list(self._variants)
+        variants.append((value, condition))
+        return ConditionalData(self._base, variants)
+
     def __repr__(self):
         return '{}(value={!r}, variants={!r})'.format(
             type(self).__name__, self._base, self._variants)
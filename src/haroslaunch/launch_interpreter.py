@@ -8,6 +8,9 @@
 ###############################################################################
 
 from collections import namedtuple
+from copy import deepcopy
+from multiprocessing import Pool
+import re
 
 from .data_structs import (
     IfCondition, ResolvedString, ResolvedValue, ResolvedYaml, SourceLocation,
@@ -28,70 +31,137 @@ from .sub_parser import (
 ###############################################################################
 
 class LaunchInterpreterError(Exception):
-    pass
+    # messages are only formatted when (and if) the error is printed
+
+    def __init__(self, cause, filepath=None, tag_name=None,
+                 line=None, column=None):
+        # `args` mirrors the parameters, so that errors can be pickled
+        super(LaunchInterpreterError, self).__init__(
+            cause, filepath, tag_name, line, column)
+        self.cause = cause # message string or original exception
+        self.filepath = filepath
+        self.tag_name = tag_name
+        self.line = line
+        self.column = column
+
+    @classmethod
+    def at_tag(cls, tag, scope, err):
+        return cls(err, filepath=scope.filepath, tag_name=tag.tag,
+                   line=tag.line, column=tag.column)
+
+    def __str__(self):
+        msg = str(self.cause) or type(self.cause).__name__
+        if self.tag_name is None:
+            return msg
+        return 'in {} <{}> [{}:{}]: {}'.format(self.filepath,
+            self.tag_name, self.line, self.column, msg)
 
 class SanityError(Exception):
+    # messages are only formatted when (and if) the error is printed
+
+    def __init__(self, template, values=(), unknown=None):
+        # `args` mirrors the parameters, so that errors can be pickled
+        super(SanityError, self).__init__(template, values, unknown)
+        self.template = template # message (format string, if `values`)
+        self.values = tuple(values) # format arguments
+        self.unknown = unknown # unknown values, listed after `values`
+
+    _MSG_CONDITIONAL = 'unable to resolve conditional <{}>: unknown {}'
     @classmethod
     def conditional_tag(cls, tag, condition):
-        what = ', '.join(x.text for x in condition.data.value.unknown)
-        msg = 'unable to resolve conditional <{}>: unknown {}'
-        return cls(msg.format(tag.tag, what))
+        unknown = condition.data.value.unknown
+        return cls(cls._MSG_CONDITIONAL, (tag.tag,), unknown)
 
+    _MSG_UNRESOLVED = 'unable to resolve {}'
     @classmethod
     def cannot_resolve(cls, unknown):
-        what = ', '.join(x.text for x in unknown)
-        return cls('unable to resolve ' + what)
+        return cls(cls._MSG_UNRESOLVED, unknown=unknown)
+
+    _MSG_UNKNOWN_TAG = 'unknown tag: <{}>'
+    @classmethod
+    def unknown_tag(cls, tag):
+        return cls(cls._MSG_UNKNOWN_TAG, (tag.tag,))
+
+    def __str__(self):
+        values = self.values
+        if self.unknown is not None:
+            values += (', '.join([x.text for x in self.unknown]),)
+        if not values:
+            return self.template
+        return self.template.format(*values)
+
+
+# errors reported (with location) as `LaunchInterpreterError`
+_INTERPRETER_ERRORS = (SchemaError, SubstitutionError, ValueError,
+                       ArgError, MachineError, SanityError)
 
 
 def _empty_value(attr):
     return ValueError('{!r} must not be empty'.format(attr))
 
+def _invalid_value(attr, value):
+    return ValueError('{!r} is not a valid value for {!r}'.format(value, attr))
+
 
 ###############################################################################
 # Helper Functions
 ###############################################################################
 
-def _launch_location(filepath, tag):
-    return SourceLocation(None, str(filepath), tag.line, tag.column)
+def _launch_location(scope, tag):
+    return SourceLocation(None, scope.filepath_str, tag.line, tag.column)
+
+# `SolverResult` is a namedtuple: (value, var_type, is_resolved, unknown)
+# unpacking is cheaper than looking up its fields one by one
 
 def _literal(substitution_result):
-    if not substitution_result.is_resolved:
-        raise SanityError.cannot_resolve(substitution_result.unknown)
-    return substitution_result.value
+    value, _, is_resolved, unknown = substitution_result
+    if not is_resolved:
+        raise SanityError.cannot_resolve(unknown)
+    return value
 
 def _literal_or_None(substitution_result):
-    if substitution_result is None or not substitution_result.is_resolved:
+    if substitution_result is None:
         return None
-    return substitution_result.value
+    value, _, is_resolved, _ = substitution_result
+    return value if is_resolved else None
+
+_WILDCARD = RosName.WILDCARD
+_WILDCARD_RUN = re.compile(re.escape(_WILDCARD) + '{2,}')
 
 def _rosname_string(substitution_result):
     if substitution_result is None:
         return ''
-    name = substitution_result.as_string(wildcard=RosName.WILDCARD)
+    name = substitution_result.as_string(wildcard=_WILDCARD)
     # collapse multiple variable symbols
-    prev = ''
-    multi = RosName.WILDCARD + RosName.WILDCARD
-    while name != prev:
-        prev = name
-        name = prev.replace(multi, RosName.WILDCARD)
-    return name
+    return _WILDCARD_RUN.sub(_WILDCARD, name)
 
 def _resolve_condition(tag, scope):
     # `tag` is a Tag object from .launch_xml_parser
     # `scope` is a Scope object from .launch_scope
+    # only resolve the attribute that is actually defined in XML;
+    # `resolve_*` return `None` for undefined attributes;
+    # literal conditions reuse the result cached by the SubstitutionParser
     t = tag.resolve_if(scope)
-    if t is None: # 'if' not defined in XML
-        f = tag.resolve_unless(scope)
-        if f is None: # 'unless' not defined in XML
-            return LOGIC_TRUE
-        if f.is_resolved:
-            return LOGIC_FALSE if f.value else LOGIC_TRUE
-        c = UnlessCondition(f, _launch_location(scope.filepath, tag))
-        return LogicVariable(f.as_string(), c)
-    if t.is_resolved:
-        return LOGIC_TRUE if t.value else LOGIC_FALSE
-    c = IfCondition(t, _launch_location(scope.filepath, tag))
-    return LogicVariable(t.as_string(), c)
+    if t is not None:
+        if t.is_resolved:
+            return LOGIC_TRUE if t.value else LOGIC_FALSE
+        c = IfCondition(t, _launch_location(scope, tag))
+        return LogicVariable(t.as_string(), c)
+    f = tag.resolve_unless(scope)
+    if f is None:
+        return LOGIC_TRUE
+    if f.is_resolved:
+        return LOGIC_FALSE if f.value else LOGIC_TRUE
+    c = UnlessCondition(f, _launch_location(scope, tag))
+    return LogicVariable(f.as_string(), c)
+
+def _require_unconditional(tag, condition):
+    # returns whether the tag is present; raises if it is conditional
+    if condition.is_true:
+        return True
+    if condition.is_false:
+        return False
+    raise SanityError.conditional_tag(tag, condition)
 
 def _resolve_ns_clear_params(tag, scope):
     clear = _literal(tag.resolve_clear_params(scope)) #!
@@ -101,19 +171,39 @@ def _resolve_ns_clear_params(tag, scope):
     ns = _rosname_string(ns)
     return (ns, clear)
 
+def _interpret_file(job):
+    # worker for `LaunchInterpreter.interpret_many()` in a separate process
+    iface, include_absent, filepath, args = job
+    lfi = LaunchInterpreter(iface, include_absent=include_absent)
+    lfi.interpret_many((filepath,), args=args)
+    return (lfi.rosparam_cmds, lfi.parameters, lfi.nodes)
+
 
 ###############################################################################
 # Launch Interpreter
 ###############################################################################
 
-_RosparamDelete = namedtuple('RosparamDelete', ('ns', 'param'))
+# type names match the module attributes, so that commands can be pickled
+_RosparamDelete = namedtuple('_RosparamDelete', ('ns', 'param'))
 _RosparamDelete.cmd = 'delete'
 
-_RosparamDump = namedtuple('RosparamDump',
+_RosparamDump = namedtuple('_RosparamDump',
     ('filepath', 'ns', 'param', 'condition'))
 _RosparamDump.cmd = 'dump'
 
 class LaunchInterpreter(object):
+    __slots__ = (
+        'iface', # system interface for queries
+        'include_absent', # whether to interpret tags with false conditions
+        'rosparam_cmds', # list of `rosparam` delete and dump commands
+        'parameters', # list of `RosParameter`
+        'nodes', # list of `RosNode` (and `RosTest`)
+        'machines', # list of `RosMachine`
+        '_file_contents', # cache of files read by `<param>` and `<rosparam>`
+        '_yaml_docs', # cache of parsed `<rosparam>` YAML (without subst.)
+        '_handlers', # dict of bound tag handlers
+    )
+
     def __init__(self, iface, include_absent=False):
         self.iface = iface
         self.include_absent = include_absent
@@ -121,6 +211,11 @@ class LaunchInterpreter(object):
         self.parameters = []
         self.nodes = []
         self.machines = []
+        self._file_contents = {} # (filepath, is_binary) -> contents
+        self._yaml_docs = {} # YAML text -> parsed value
+        # bind handlers once, instead of on every dispatch
+        self._handlers = {name: getattr(self, handler.__name__)
+                          for name, handler in self._TAG_HANDLERS.items()}
 
     def to_JSON_object(self):
         return {
@@ -135,69 +230,107 @@ class LaunchInterpreter(object):
         # log debug interpret(filepath, args=args)
         tree = self.iface.request_parse_tree(filepath)
         assert tree.tag == 'launch'
-        tree.check_schema()
         args = dict(args) if args is not None else {}
         scope = LaunchScope(filepath, self.iface, args=args)
         self._interpret_tree(tree, scope)
         self.machines.extend(scope.machines.values())
 
-    def interpret_many(self, filepaths, args=None):
+    def interpret_many(self, filepaths, args=None, processes=None):
         # filepaths is a list of pathlib Path
+        # processes > 1 interprets files in parallel, in worker processes;
+        #   requires `iface` to be picklable
         # log debug interpret_many(filepaths, args=args)
+        args = args if args is not None else {}
+        if processes is not None and processes > 1:
+            return self._interpret_parallel(filepaths, args, processes)
         for filepath in filepaths:
             tree = self.iface.request_parse_tree(filepath)
             assert tree.tag == 'launch'
-            tree.check_schema()
-            args = dict(args) if args is not None else {}
-            scope = LaunchScope(filepath, self.iface, args=args)
+            scope = LaunchScope(filepath, self.iface, args=dict(args))
             self._interpret_tree(tree, scope)
         # parameters can only be added in the end, because of rosparam
         # TODO
         #for param in scope.parameters:
         #    self.configuration.parameters.add(param)
 
+    def _interpret_parallel(self, filepaths, args, processes):
+        # files are independent (each has its own `LaunchScope`)
+        jobs = [(self.iface, self.include_absent, filepath, args)
+                for filepath in filepaths]
+        pool = Pool(processes)
+        try:
+            results = pool.map(_interpret_file, jobs)
+        finally:
+            pool.close()
+            pool.join()
+        # merge in the original order of `filepaths`
+        for rosparam_cmds, parameters, nodes in results:
+            self.rosparam_cmds.extend(rosparam_cmds)
+            self.parameters.extend(parameters)
+            self.nodes.extend(nodes)
+
     def _interpret_tree(self, tree, scope):
-        for tag in tree.children:
-            try:
-                tag.check_schema()
+        # Iterative depth-first traversal, to avoid deep recursion.
+        # Handlers of tags with children are generators that yield
+        # `(tree, scope)` pairs to descend into; each stack frame holds
+        # the remaining children of a tree, the scope to interpret them in,
+        # and the suspended handler (with its tag and scope), if any.
+        # Trees need no schema check here: each tag checks its own schema
+        # (and its children) when the parser builds it.
+        include_absent = self.include_absent
+        interpret_tag = self._interpret_tag
+        resume = self._resume
+        make_params = self._make_params
+        stack = [(iter(tree.children), scope, None, None, None)]
+        while stack:
+            children, scope = stack[-1][:2]
+            frame = None
+            for tag in children:
+                task = interpret_tag(tag, scope, include_absent)
+                if task is not None:
+                    frame = resume(tag, scope, task)
+                    if frame is not None:
+                        break
+            else:
+                _, scope, tag, parent_scope, task = stack.pop()
+                make_params(scope)
+                if task is not None:
+                    frame = resume(tag, parent_scope, task)
+            if frame is not None:
+                stack.append(frame)
+
+    def _interpret_tag(self, tag, scope, include_absent):
+        # returns a generator if the handler has subtrees to interpret
+        try:
+            if tag.is_conditional:
                 condition = _resolve_condition(tag, scope)
                 assert condition.is_atomic
-                if condition.is_false and not self.include_absent:
-                    continue
-                if tag.tag == 'arg':
-                    self._arg_tag(tag, scope, condition)
-                elif tag.tag == 'node':
-                    self._node_tag(tag, scope, condition)
-                elif tag.tag == 'remap':
-                    self._remap_tag(tag, scope, condition)
-                elif tag.tag == 'param':
-                    self._param_tag(tag, scope, condition)
-                elif tag.tag == 'rosparam':
-                    self._rosparam_tag(tag, scope, condition)
-                elif tag.tag == 'include':
-                    self._include_tag(tag, scope, condition)
-                elif tag.tag == 'group':
-                    self._group_tag(tag, scope, condition)
-                elif tag.tag == 'env':
-                    self._env_tag(tag, scope, condition)
-                elif tag.tag == 'machine':
-                    self._machine_tag(tag, scope, condition)
-                elif tag.tag == 'test':
-                    self._test_tag(tag, scope, condition)
-                else:
-                    self._fail(tag, scope, 'unknown tag: ' + str(tag))
-            except (SchemaError, SubstitutionError, ValueError,
-                    ArgError, MachineError, SanityError) as err:
-                self._fail(tag, scope, err)
-        self._make_params(scope)
+                if condition.is_false and not include_absent:
+                    return None
+            else:
+                # fast path: no 'if' or 'unless' to resolve
+                condition = LOGIC_TRUE
+            handler = self._handlers.get(tag.tag)
+            if handler is None:
+                raise SanityError.unknown_tag(tag)
+            return handler(tag, scope, condition)
+        except _INTERPRETER_ERRORS as err:
+            self._fail(tag, scope, err)
+
+    def _resume(self, tag, scope, task):
+        # runs a suspended handler until it yields its next subtree
+        try:
+            tree, new_scope = next(task)
+        except StopIteration:
+            return None
+        except _INTERPRETER_ERRORS as err:
+            self._fail(tag, scope, err)
+        return (iter(tree.children), new_scope, tag, scope, task)
 
     def _arg_tag(self, tag, scope, condition):
         assert not tag.children
-        if condition.is_false:
+        if not _require_unconditional(tag, condition):
             return
-        if condition.is_variable:
-            raise SanityError.conditional_tag(tag, condition)
-        assert condition.is_true
         name = _literal(tag.resolve_name(scope))
         value = tag.resolve_value(scope)
         if value is None:
@@ -207,7 +340,7 @@ class LaunchInterpreter(object):
             scope.declare_arg(name, default=value)
         else:
             # define arg with final value
-            value = value.value if value.is_resolved else None
+            value = _literal_or_None(value)
             scope.set_arg(name, value)
 
     def _node_tag(self, tag, scope, condition):
@@ -231,13 +364,13 @@ class LaunchInterpreter(object):
         output = tag.resolve_output(scope)
         cwd = tag.resolve_cwd(scope)
         prefix = tag.resolve_launch_prefix(scope)
-        location = _launch_location(scope.filepath, tag)
+        location = _launch_location(scope, tag)
         new_scope = scope.new_node(name, pkg, exe, condition, ns=ns, #!
             machine=machine, required=required, respawn=respawn, delay=delay,
             args=args, output=output, cwd=cwd, prefix=prefix, location=location)
         if clear:
             self._clear_params(str(new_scope.private_ns))
-        self._interpret_tree(tag, new_scope)
+        yield tag, new_scope
         self.nodes.append(new_scope.node)
 
     def _remap_tag(self, tag, scope, condition):
@@ -251,20 +384,16 @@ class LaunchInterpreter(object):
         assert not tag.children
         name = _rosname_string(tag.resolve_name(scope))
         param_type = _literal(tag.resolve_type(scope)) #!
-        if tag.is_value_param:
+        kind = tag.param_kind
+        if kind == 'value': # most common case
             value = tag.resolve_value(scope)
-        elif tag.is_textfile_param:
-            value = self._param_tag_textfile(tag, scope)
-        elif tag.is_binfile_param:
-            value = self._param_tag_binfile(tag, scope)
         else:
-            assert tag.is_command_param
-            value = self._param_tag_command(tag, scope)
+            value = self._PARAM_LOADERS[kind](self, tag, scope)
         if value.is_resolved:
             assert isinstance(value.value, STRING_TYPES)
             value = convert_value(value.value, param_type=param_type) #!
             value = ResolvedValue(value, param_type)
-        location = _launch_location(scope.filepath, tag)
+        location = _launch_location(scope, tag)
         scope.set_param(name, value, param_type, condition, location=location)
 
     def _param_tag_textfile(self, tag, scope):
@@ -272,7 +401,7 @@ class LaunchInterpreter(object):
         if value.is_resolved:
             try:
                 # iface check - if tag.textfile_attr.startswith('$(find ')
-                value = self.iface.read_text_file(value.value)
+                value = self._read_file(value.value, False)
                 value = ResolvedString(value)
             except EnvironmentError as err:
                 value = UnresolvedFileContents(value.value)
@@ -283,7 +412,7 @@ class LaunchInterpreter(object):
         if value.is_resolved:
             try:
                 # iface check - if tag.binfile_attr.startswith('$(find ')
-                value = self.iface.read_binary_file(value.value)
+                value = self._read_file(value.value, True)
                 value = ResolvedString(value)
             except EnvironmentError as err:
                 value = UnresolvedFileContents(value.value)
@@ -302,22 +431,24 @@ class LaunchInterpreter(object):
     def _rosparam_tag(self, tag, scope, condition):
         assert not tag.children
         command = _literal(tag.resolve_command(scope)) #!
-        if command == 'load':
-            self._rosparam_tag_load(tag, scope, condition)
-        elif command == 'delete':
-            self._rosparam_tag_delete(tag, scope, condition)
-        else:
-            assert command == 'dump'
-            self._rosparam_tag_dump(tag, scope, condition)
+        if command != 'load' and condition.is_false:
+            return # absent 'delete' and 'dump' commands have no effect
+        # all commands share the `ns` and `param` attributes
+        ns = _rosname_string(tag.resolve_ns(scope))
+        param = _rosname_string(tag.resolve_param(scope))
+        handler = self._ROSPARAM_COMMANDS.get(command)
+        if handler is None: # e.g., substitution with an unexpected value
+            raise _invalid_value('command', command)
+        handler(self, tag, scope, condition, ns, param)
 
-    def _rosparam_tag_load(self, tag, scope, condition):
+    def _rosparam_tag_load(self, tag, scope, condition, ns, param):
         value = yaml_text = None
         filepath = tag.resolve_file(scope)
         if filepath is None: # not defined in XML
             yaml_text = tag.text
         elif filepath.is_resolved:
             try:
-                yaml_text = self.iface.read_text_file(filepath.value)
+                yaml_text = self._read_file(filepath.value, False)
             except EnvironmentError as err:
                 value = UnresolvedFileContents(filepath.value)
         else:
@@ -327,37 +458,31 @@ class LaunchInterpreter(object):
             assert isinstance(yaml_text, STRING_TYPES)
             subst_value = _literal(tag.resolve_subst_value(scope)) #!
             if subst_value:
-                value = resolve_to_yaml(yaml_text, scope) #!
+                if filepath is None:
+                    # inline text goes through the tag's cached parser
+                    value = tag.resolve_yaml_text(scope)
+                else:
+                    value = resolve_to_yaml(yaml_text, scope) #!
                 if value.is_resolved and value.value is None:
                     value = ResolvedYaml({})
             else:
-                value = convert_to_yaml(yaml_text) #!
+                value = self._load_yaml(yaml_text) #!
                 value = ResolvedYaml(value if value is not None else {})
         assert value is not None
-        ns = _rosname_string(tag.resolve_ns(scope))
-        param = _rosname_string(tag.resolve_param(scope))
         if value.is_resolved:
             if not param and type(value.value) != dict:
                 raise SchemaError.missing_attr('param')
-        location = _launch_location(scope.filepath, tag)
+        location = _launch_location(scope, tag)
         scope.set_param(param, value, value.param_type, condition,
             ns=ns, location=location)
 
-    def _rosparam_tag_delete(self, tag, scope, condition):
-        if condition.is_false:
+    def _rosparam_tag_delete(self, tag, scope, condition, ns, param):
+        if not _require_unconditional(tag, condition):
             return
-        if condition.is_variable:
-            raise SanityError.conditional_tag(tag, condition)
-        ns = _rosname_string(tag.resolve_ns(scope))
-        param = _rosname_string(tag.resolve_param(scope))
         cmd = _RosparamDelete(ns, param)
         self.rosparam_cmds.append(cmd)
 
-    def _rosparam_tag_dump(self, tag, scope, condition):
-        if condition.is_false:
-            return
-        ns = _rosname_string(tag.resolve_ns(scope))
-        param = _rosname_string(tag.resolve_param(scope))
+    def _rosparam_tag_dump(self, tag, scope, condition, ns, param):
         filepath = _literal(tag.resolve_file(scope)) #!
         cmd = _RosparamDump(filepath, ns, param, condition)
         self.rosparam_cmds.append(cmd)
@@ -369,12 +494,11 @@ class LaunchInterpreter(object):
         new_scope = scope.new_include(filepath, ns, condition, pass_all_args)
         if clear:
             self._clear_params(new_scope.ns)
-        self._interpret_tree(tag, new_scope)
+        yield tag, new_scope
         new_scope = new_scope.new_launch()
         tree = self.iface.request_parse_tree(filepath) #!
         assert tree.tag == 'launch'
-        tree.check_schema() #!
-        self._interpret_tree(tree, new_scope)
+        yield tree, new_scope
         # TODO: RLException: unused args [arg1, arg2] for include of ...
 
     def _group_tag(self, tag, scope, condition):
@@ -383,7 +507,7 @@ class LaunchInterpreter(object):
         new_scope = scope.new_group(ns, condition) # default=scope.ns
         if clear:
             self._clear_params(new_scope.ns)
-        self._interpret_tree(tag, new_scope)
+        yield tag, new_scope
 
     def _env_tag(self, tag, scope, condition):
         assert not tag.children
@@ -428,24 +552,70 @@ class LaunchInterpreter(object):
         prefix = tag.resolve_launch_prefix(scope)
         retry = tag.resolve_retry(scope)
         time_limit = tag.resolve_time_limit(scope)
-        location = _launch_location(scope.filepath, tag)
+        location = _launch_location(scope, tag)
         new_scope = scope.new_test(test_name, name, pkg, exe, condition, #!
             ns=ns, args=args, cwd=cwd, prefix=prefix, retries=retry,
             time_limit=time_limit, location=location)
         if clear:
             self._clear_params(str(new_scope.private_ns))
-        self._interpret_tree(tag, new_scope)
+        yield tag, new_scope
         self.nodes.append(new_scope.node)
 
     def _clear_params(self, ns):
         cmd = _RosparamDelete(ns, '')
         self.rosparam_cmds.append(cmd)
 
+    def _read_file(self, filepath, binary):
+        # the same files tend to be loaded from many places in a launch graph
+        # (e.g., `$(find pkg)/config/robot.yaml`); read each only once
+        key = (filepath, binary)
+        contents = self._file_contents.get(key)
+        if contents is None:
+            if binary:
+                contents = self.iface.read_binary_file(filepath)
+            else:
+                contents = self.iface.read_text_file(filepath)
+            self._file_contents[key] = contents
+        return contents
+
+    def _load_yaml(self, yaml_text):
+        # the same configuration files are often loaded in many namespaces;
+        # parse each document once, but hand out copies, since the values
+        # end up (mutable) in separate parameters
+        try:
+            value = self._yaml_docs[yaml_text]
+        except KeyError:
+            value = convert_to_yaml(yaml_text) #!
+            self._yaml_docs[yaml_text] = value
+        return deepcopy(value)
+
     def _make_params(self, scope):
-        for param in scope.params:
-            self.parameters.append(param)
+        self.parameters.extend(scope.params)
 
     def _fail(self, tag, scope, err):
-        msg = str(err) or type(err).__name__
-        raise LaunchInterpreterError('in {} <{}> [{}:{}]: {}'.format(
-            scope.filepath, tag.tag, tag.line, tag.column, msg))
+        raise LaunchInterpreterError.at_tag(tag, scope, err)
+
+    _PARAM_LOADERS = {
+        'textfile': _param_tag_textfile,
+        'binfile': _param_tag_binfile,
+        'command': _param_tag_command
+    }
+
+    _ROSPARAM_COMMANDS = {
+        'load': _rosparam_tag_load,
+        'delete': _rosparam_tag_delete,
+        'dump': _rosparam_tag_dump
+    }
+
+    _TAG_HANDLERS = {
+        'arg': _arg_tag,
+        'node': _node_tag,
+        'remap': _remap_tag,
+        'param': _param_tag,
+        'rosparam': _rosparam_tag,
+        'include': _include_tag,
+        'group': _group_tag,
+        'env': _env_tag,
+        'machine': _machine_tag,
+        'test': _test_tag
+    }
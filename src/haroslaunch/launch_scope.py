@@ -60,8 +60,20 @@ class MachineError(KeyError):
 # Helper Functions
 ###############################################################################
 
+# sentinel for undeclared args; `None` is a valid (unknown) arg value
+_UNDECLARED = object()
+
+# the host name does not change; `gethostname()` is a system call
+_HOSTNAME = None
+
+def _hostname():
+    global _HOSTNAME
+    if _HOSTNAME is None:
+        _HOSTNAME = socket.gethostname()
+    return _HOSTNAME
+
 def _yaml_param(name, ns, pns, value, condition, location):
-    params = []
+    # yields parameters one at a time; consumed once by `_set_ros_params`
     for key, literal in _unfold(name, value):
         RosName.check_valid_name(key, no_ns=False, no_empty=True)
         ros_name = RosName(key, ns=ns, pns=pns)
@@ -75,12 +87,10 @@ def _yaml_param(name, ns, pns, value, condition, location):
             v = ResolvedString(literal)
         else:
             v = ResolvedYaml(literal)
-        params.append(RosParameter(ros_name, v.param_type, v,
-            condition=condition, location=location))
-    return params
+        yield RosParameter(ros_name, v.param_type, v,
+            condition=condition, location=location)
 
 def _unfold(name, value):
-    result = []
     stack = [('', name, value)]
     while stack:
         ns, key, value = stack.pop()
@@ -94,12 +104,12 @@ def _unfold(name, value):
 
 def _ns_join(name, ns):
     '''Dumb version of name resolution to mimic ROS behaviour.'''
-    if name.startswith('~') or name.startswith('/'):
+    # called for every YAML leaf; compare the first char directly
+    c = name[:1]
+    if c == '~' or c == '/' or not ns:
         return name
     if ns == '~':
         return '~' + name
-    if not ns:
-        return name
     if ns[-1] == '/':
         return ns + name
     return ns + '/' + name
@@ -124,6 +134,8 @@ class BaseScope(object):
         'fwd_params', # list of declared forward parameters
         'machines', # `VariantDict` of machines
         '_machine', # singleton list containing the default machine
+        '_launch_file', # cached `filepath` of the parent scope
+        '_launch_file_str', # cached `str(filepath)` for source locations
     )
 
     def __init__(self, parent, iface, ns, args, arg_defaults, condition,
@@ -153,6 +165,13 @@ class BaseScope(object):
         self.fwd_params = fwd_params
         self.machines = machines
         self._machine = def_machine
+        # the launch file does not change within a scope chain;
+        # avoid walking up the parents on every access
+        if parent is None:
+            self._launch_file = self._launch_file_str = None
+        else:
+            self._launch_file = parent.filepath
+            self._launch_file_str = parent.filepath_str
 
     @property
     def private_ns(self):
@@ -160,9 +179,11 @@ class BaseScope(object):
 
     @property
     def filepath(self):
-        if self.parent is None:
-            return None
-        return self.parent.filepath
+        return self._launch_file
+
+    @property
+    def filepath_str(self):
+        return self._launch_file_str
 
     @property
     def dirpath(self):
@@ -205,12 +226,10 @@ class BaseScope(object):
         return conditions
 
     def get_arg(self, name):
-        if name not in self.arg_defaults:
+        default = self.arg_defaults.get(name, _UNDECLARED)
+        if default is _UNDECLARED:
             raise ArgError.undeclared(name)
-        try:
-            return self.args[name]
-        except KeyError:
-            return self.arg_defaults[name]
+        return self.args.get(name, default)
 
     def declare_arg(self, name, default=None):
         assert isinstance(name, str)
@@ -233,7 +252,8 @@ class BaseScope(object):
         assert isinstance(name, str)
         assert isinstance(value, SolverResult)
         assert isinstance(condition, LogicValue)
-        self.node_env[name].set(value, condition)
+        # copy-on-write: child scopes and nodes share the previous entry
+        self.node_env[name] = self.node_env[name].updated(value, condition)
 
     def get_pkg_path(self, name):
         assert isinstance(name, str)
@@ -250,7 +270,8 @@ class BaseScope(object):
 
     def _anonymous_name(self, name):
         # Behaviour copied from rosgraph.names.anonymous_name(id)
-        name = '{}_{}_{}_{}'.format(name, socket.gethostname(),
+        # (`getpid()` is not cached; it changes in forked workers)
+        name = '{}_{}_{}_{}'.format(name, _hostname(),
             os.getpid(), random.randint(0, sys.maxsize))
         return name.replace('.', '_').replace('-', '_').replace(':', '_')
 
@@ -262,7 +283,8 @@ class BaseScope(object):
         RosName.check_valid_name(to_name, no_ns=False, no_empty=True)
         source = RosName.resolve(from_name, ns=self.ns, pns=self.private_ns)
         target = RosName.resolve(to_name, ns=self.ns, pns=self.private_ns)
-        self.remaps[source].set(target, condition)
+        # copy-on-write: child scopes and nodes share the previous entry
+        self.remaps[source] = self.remaps[source].updated(target, condition)
 
     def set_param(self, name, value, param_type, condition,
                   ns='', location=None):
@@ -430,7 +452,7 @@ class BaseScope(object):
 
 
 class LaunchScope(BaseScope):
-    __slots__ = BaseScope.__slots__ + ('_filepath',)
+    __slots__ = BaseScope.__slots__
 
     def __init__(self, filepath, iface, ns='/', args=None, anon=None,
                  remaps=None, node_env=None, fwd_params=None,
@@ -452,11 +474,8 @@ class LaunchScope(BaseScope):
         super(LaunchScope, self).__init__(None, iface, ns, args,
             arg_defaults, LOGIC_TRUE, anon, remaps, node_env,
             fwd_params, machines, def_machine)
-        self._filepath = filepath
-
-    @property
-    def filepath(self):
-        return self._filepath
+        self._launch_file = filepath
+        self._launch_file_str = str(filepath)
 
 
 class GroupScope(BaseScope):
@@ -35,8 +35,8 @@ class LaunchParserError(Exception):
         return cls('invalid root tag <{}>'.format(tag_name))
 
     @classmethod
-    def unknown_tag(cls, tag):
-        return cls('unknown tag {tag.tag!r}')
+    def unknown_tag(cls, tag_name):
+        return cls('unknown tag: <{}>'.format(tag_name))
 
 
 class SchemaError(Exception):
@@ -73,11 +73,40 @@ def _empty_value(attr):
     return ValueError('{!r} must not be empty'.format(attr))
 
 
+###############################################################################
+# Substitution Cache
+###############################################################################
+
+# Attribute values such as '$(arg robot)' or 'true' repeat across tags and
+# files; parse each (text, type) once and share the parser, since
+# `SubstitutionParser.resolve()` does not modify the parser.
+_SUBSTITUTIONS = {}
+_MAX_SUBSTITUTIONS = 4096
+
+def _parse_substitution(text, param_type):
+    key = (text, param_type)
+    parser = _SUBSTITUTIONS.get(key)
+    if parser is None:
+        if len(_SUBSTITUTIONS) >= _MAX_SUBSTITUTIONS:
+            _SUBSTITUTIONS.clear()
+        parser = SubstitutionParser(text, param_type=param_type)
+        _SUBSTITUTIONS[key] = parser
+    return parser
+
+
 ###############################################################################
 # Launch XML Tags
 ###############################################################################
 
 class BaseLaunchTag(object):
+    __slots__ = (
+        'text', # string with the text content of the XML element
+        'line', # line number of the XML element in the source file
+        'column', # column number of the XML element in the source file
+        'attributes', # dict of XML attributes (name -> raw string)
+        'children', # list of child tags (subclasses of `BaseLaunchTag`)
+    )
+
     CHILDREN = ()
     REQUIRED = ()
     ATTRIBUTES = {
@@ -144,7 +173,7 @@ class BaseLaunchTag(object):
         if xml_value is None:
             return None
         param_type = self.ATTRIBUTES[attr]
-        unresolved = SubstitutionParser(xml_value, param_type=param_type)
+        unresolved = _parse_substitution(xml_value, param_type)
         result = unresolved.resolve(scope)
         if result.is_resolved:
             value = result.value
@@ -208,6 +237,8 @@ class BaseLaunchTag(object):
 
 
 class LaunchTag(BaseLaunchTag):
+    __slots__ = ()
+
     CHILDREN = ('node', 'include', 'remap', 'param', 'rosparam',
                 'group', 'arg', 'env', 'machine', 'test')
     ATTRIBUTES = {}
@@ -226,6 +257,8 @@ class LaunchTag(BaseLaunchTag):
 
 
 class ArgTag(BaseLaunchTag):
+    __slots__ = ()
+
     REQUIRED = ('name',)
     ATTRIBUTES = {
         'if': TYPE_BOOL,
@@ -274,6 +307,8 @@ class ArgTag(BaseLaunchTag):
 
 
 class NodeTag(BaseLaunchTag):
+    __slots__ = ()
+
     CHILDREN = ('remap', 'param', 'rosparam', 'env')
     REQUIRED = ('name', 'pkg', 'type')
     ATTRIBUTES = {
@@ -399,6 +434,8 @@ class NodeTag(BaseLaunchTag):
 
 
 class IncludeTag(BaseLaunchTag):
+    __slots__ = ()
+
     CHILDREN = ('arg', 'env')
     REQUIRED = ('file',)
     ATTRIBUTES = {
@@ -448,6 +485,8 @@ class IncludeTag(BaseLaunchTag):
 
 
 class RemapTag(BaseLaunchTag):
+    __slots__ = ()
+
     REQUIRED = ('from', 'to')
     ATTRIBUTES = {
         'if': TYPE_BOOL,
@@ -476,6 +515,8 @@ class RemapTag(BaseLaunchTag):
 
 
 class ParamTag(BaseLaunchTag):
+    __slots__ = ('_param_kind',)
+
     REQUIRED = ('name',)
     ATTRIBUTES = {
         'if': TYPE_BOOL,
@@ -520,6 +561,12 @@ class ParamTag(BaseLaunchTag):
     def command_attr(self):
         return self.attributes.get('command')
 
+    @property
+    def param_kind(self):
+        # one of 'value', 'textfile', 'binfile' or 'command'
+        # computed along with the schema check
+        return self._param_kind
+
     @property
     def is_value_param(self):
         return self.attributes.get('value') is not None
@@ -565,9 +612,12 @@ class ParamTag(BaseLaunchTag):
             defined = attr
         if not defined:
             raise SchemaError.missing_attr('value')
+        self._param_kind = defined
 
 
 class RosparamTag(BaseLaunchTag):
+    __slots__ = ()
+
     ATTRIBUTES = {
         'if': TYPE_BOOL,
         'unless': TYPE_BOOL,
@@ -635,8 +685,7 @@ class RosparamTag(BaseLaunchTag):
 
     def resolve_yaml_text(self, scope):
         # returns `SubstitutionResult`
-        unresolved = SubstitutionParser(self.text, param_type=TYPE_YAML)
-        return unresolved.resolve(scope)
+        return _parse_substitution(self.text, TYPE_YAML).resolve(scope)
 
     def _check_tag_schema(self):
         if self.command_attr == 'load':
@@ -653,6 +702,8 @@ class RosparamTag(BaseLaunchTag):
 
 
 class GroupTag(BaseLaunchTag):
+    __slots__ = ()
+
     CHILDREN = ('node', 'include', 'remap', 'param', 'rosparam',
                 'group', 'arg', 'env', 'machine', 'test')
     ATTRIBUTES = {
@@ -686,6 +737,8 @@ class GroupTag(BaseLaunchTag):
 
 
 class EnvTag(BaseLaunchTag):
+    __slots__ = ()
+
     REQUIRED = ('name', 'value')
     ATTRIBUTES = {
         'if': TYPE_BOOL,
@@ -714,6 +767,8 @@ class EnvTag(BaseLaunchTag):
 
 
 class MachineTag(BaseLaunchTag):
+    __slots__ = ()
+
     REQUIRED = ('name', 'address')
     ATTRIBUTES = {
         'if': TYPE_BOOL,
@@ -794,6 +849,8 @@ class MachineTag(BaseLaunchTag):
 
 
 class TestTag(BaseLaunchTag):
+    __slots__ = ()
+
     CHILDREN = ('remap', 'param', 'rosparam', 'env')
     REQUIRED = ('test-name', 'pkg', 'type')
     ATTRIBUTES = {
@@ -974,11 +1031,11 @@ def parse(xml_text):
 
 
 def _parse_tag(xml_tag):
-    if not xml_tag.tag in TAGS:
-        raise LaunchParserError('unknown tag: <{}>'.format(xml_tag.tag))
-    cls = TAGS[xml_tag.tag]
+    cls = TAGS.get(xml_tag.tag)
+    if cls is None:
+        raise LaunchParserError.unknown_tag(xml_tag.tag)
     text = xml_tag.text if xml_tag.text else ''
-    if xml_tag.tag != 'rosparam':
+    if cls is not RosparamTag:
         text = text.strip()
     try:
         element = cls(text, xml_tag.attrib,
@@ -12,6 +12,12 @@ try:
     import regex as re
 except ImportError:
     import re
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: the built-in `intern()` rejects `unicode` names
+    def intern(name):
+        return name
 
 from .data_structs import (
     ResolvedBool, ResolvedDouble, ResolvedInt, ResolvedString, VariantDict,
@@ -97,13 +103,14 @@ class RosName(object):
         self._name = RosName.resolve(name, ns=ns, pns=pns)
         # RosName.check_valid_name(self._name, no_ns=False, no_empty=False)
         self._given = name
+        # namespaces repeat across most names; share a single string
         if self._name.endswith('/'):
             self._own = ''
-            self._ns = self._name
+            self._ns = intern(self._name)
         else:
             parts = self._name.rsplit('/', 1)
             self._own = parts[-1]
-            self._ns = parts[0] or '/'
+            self._ns = intern(parts[0] or '/')
 
     @property
     def full(self):
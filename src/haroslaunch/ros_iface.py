@@ -24,8 +24,9 @@ from .launch_xml_parser import parse_from_file
 
 class SimpleRosInterface(object):
     def __init__(self, strict=False):
-        self.ast_cache = {}
+        self.ast_cache = {} # filepath -> tree
         self.strict = strict
+        self._ast_mtimes = {} # filepath -> mtime of the cached tree
 
     @property
     def ros_distro(self):
@@ -58,10 +59,13 @@ class SimpleRosInterface(object):
             safe_dir = safe_dir or str(Path(os.environ.get('ROS_ROOT')).parent)
             if safe_dir and not filepath.startswith(safe_dir):
                 raise ValueError(filepath)
+        # cached trees are reused until the file is modified
+        mtime = os.path.getmtime(filepath)
         ast = self.ast_cache.get(filepath)
-        if ast is None:
+        if ast is None or self._ast_mtimes.get(filepath) != mtime:
             ast = parse_from_file(filepath) #!
             self.ast_cache[filepath] = ast
+            self._ast_mtimes[filepath] = mtime
         return ast
 
     def read_text_file(self, filepath):
@@ -34,6 +34,16 @@ DEG_PATTERN = re.compile(r'^deg\([^\)]*\)$')
 
 TAG_UNICODE = u'tag:yaml.org,2002:python/unicode'
 
+# libyaml-based loader, if PyYAML was built with it (much faster);
+# it does not inherit the constructors registered with `SafeLoader`
+try:
+    SafeLoader = yaml.CSafeLoader
+except AttributeError:
+    SafeLoader = yaml.SafeLoader
+
+_SAFE_LOADERS = (yaml.SafeLoader,) if SafeLoader is yaml.SafeLoader \
+    else (yaml.SafeLoader, SafeLoader)
+
 ###############################################################################
 # Errors and Exceptions
 ###############################################################################
@@ -92,19 +102,23 @@ def construct_unicode(loader, node):
 # binary data
 yaml.add_representer(Binary, represent_xml_binary)
 yaml.add_constructor(TAG_YAML_BINARY, construct_yaml_binary)
-yaml.SafeLoader.add_constructor(TAG_YAML_BINARY, construct_yaml_binary)
+for loader in _SAFE_LOADERS:
+    loader.add_constructor(TAG_YAML_BINARY, construct_yaml_binary)
 
 # radians (allow !radians 2*pi)
 yaml.add_constructor(YAML_RAD, construct_angle_radians)
-yaml.SafeLoader.add_constructor(YAML_RAD, construct_angle_radians)
 yaml.add_implicit_resolver(YAML_RAD, RAD_PATTERN, first=RAD_START)
-yaml.SafeLoader.add_implicit_resolver(YAML_RAD, RAD_PATTERN, first=RAD_START)
+for loader in _SAFE_LOADERS:
+    loader.add_constructor(YAML_RAD, construct_angle_radians)
+    loader.add_implicit_resolver(YAML_RAD, RAD_PATTERN, first=RAD_START)
 
 # degrees (allow !degrees 180)
 yaml.add_constructor(YAML_DEG, construct_angle_degrees)
-yaml.SafeLoader.add_constructor(YAML_DEG, construct_angle_degrees)
 yaml.add_implicit_resolver(YAML_DEG, DEG_PATTERN, first=DEG_START)
-yaml.SafeLoader.add_implicit_resolver(YAML_DEG, DEG_PATTERN, first=DEG_START)
+for loader in _SAFE_LOADERS:
+    loader.add_constructor(YAML_DEG, construct_angle_degrees)
+    loader.add_implicit_resolver(YAML_DEG, DEG_PATTERN, first=DEG_START)
 
 # unicode
-yaml.SafeLoader.add_constructor(TAG_UNICODE, construct_unicode)
+for loader in _SAFE_LOADERS:
+    loader.add_constructor(TAG_UNICODE, construct_unicode)
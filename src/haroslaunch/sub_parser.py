@@ -18,7 +18,7 @@ from .data_structs import (
     TYPE_AUTO, STRING_TYPES,
     ResolvedValue, UnknownValue, UnresolvedValue,
 )
-from .rosparam_yaml_monkey_patch import yaml
+from .rosparam_yaml_monkey_patch import SafeLoader, yaml
 
 ###############################################################################
 # Errors and Exceptions
@@ -308,10 +308,11 @@ def _strip(s):
 #   else:
 #       print('Resolved to the string ' + repr(result.value))
 class SubstitutionParser(object):
-    __slots__ = ('text', 'param_type', '_commands')
+    __slots__ = ('text', 'param_type', '_commands', '_literal')
     # `text`: original string to parse and resolve
     # `param_type`: expected conversion type (str) or None
     # `_commands`: internal list of commands for value resolution
+    # `_literal`: cached result for text without substitutions, or None
 
     SUB_PATTERN = re.compile(r'\$\(([^$()]+?)\)')
     ERROR_PATTERN = re.compile(r'\$\([^\$\(\)]*?\$[^\)]*?\)')
@@ -321,6 +322,7 @@ class SubstitutionParser(object):
             raise TypeError('expected a string: {!r}'.format(value))
         self.text = value
         self.param_type = param_type
+        self._literal = None
         self._build_command_list(value)
 
     @classmethod
@@ -347,6 +349,8 @@ class SubstitutionParser(object):
     # `r.value` is converted to `self.param_type` if possible
     # throws SubstitutionError, ValueError
     def resolve(self, scope):
+        if self._literal is not None:
+            return self._literal
         parts = []
         unknown = False
         for cmd in self._commands:
@@ -361,7 +365,13 @@ class SubstitutionParser(object):
             return UnresolvedValue(parts, self.param_type)
         value = ''.join(parts)
         value = convert_value(value, param_type=self.param_type) #!
-        return ResolvedValue(value, self.param_type)
+        result = ResolvedValue(value, self.param_type)
+        # plain text resolves the same in every scope; YAML values are
+        # mutable containers, so those are converted on every call
+        if (self.param_type != TYPE_YAML and len(self._commands) == 1
+                and type(self._commands[0]) is DummyCommand):
+            self._literal = result
+        return result
 
     def _build_command_list(self, value):
         self._commands = []
@@ -380,7 +390,9 @@ class SubstitutionParser(object):
             return self._commands.append(DummyCommand(args))
         rest = value
         while match:
-            parts = filter(bool, map(_strip, match.group(1).split(None, 1)))
+            # `filter` returns an iterator in Python 3
+            parts = match.group(1).split(None, 1)
+            parts = [s for s in map(_strip, parts) if s]
             assert len(parts) == 1 or len(parts) == 2
             cmd_name = parts[0]
             arg_str = parts[1] if len(parts) == 2 else ''
@@ -458,7 +470,7 @@ def convert_value(value, param_type=None):
         raise ValueError('{!r} is not a bool'.format(value))
     elif param_type == TYPE_YAML:
         try:
-            return yaml.safe_load(value)
+            return yaml.load(value, Loader=SafeLoader)
         except yaml.parser.ParserError as e:
             raise ValueError(e)
     else:
@@ -8,13 +8,174 @@
 ###############################################################################
 
 from pathlib import Path
+import pickle
+import sys
 
 from hypothesis import given
 
 from haroslaunch.launch_interpreter import (
-    LaunchInterpreter, LaunchInterpreterError
+    LaunchInterpreter, LaunchInterpreterError, SanityError
 )
+from haroslaunch.launch_xml_parser import parse
+
+###############################################################################
+# Mock ROS Interface
+###############################################################################
+
+class MockInterface(object):
+    def __init__(self, files):
+        self.files = files # filepath -> XML text or parsed tree
+        self.reads = [] # (filepath, binary) of every file read
+
+    def request_parse_tree(self, filepath):
+        tree = self.files[str(filepath)]
+        if isinstance(tree, str):
+            tree = parse(tree)
+        return tree
+
+    def read_text_file(self, filepath):
+        self.reads.append((str(filepath), False))
+        return self.files[str(filepath)]
+
+    def read_binary_file(self, filepath):
+        self.reads.append((str(filepath), True))
+        return self.files[str(filepath)].encode('utf-8')
+
+    def get_environment_variable(self, name):
+        return None
 
 ###############################################################################
 # Tests
 ###############################################################################
+
+def test_group_remap_does_not_leak():
+    iface = MockInterface({'/a.launch': '''<launch>
+        <remap from="a" to="b"/>
+        <group><remap from="a" to="c"/></group>
+        <node name="n" pkg="p" type="t"/>
+    </launch>'''})
+    lfi = LaunchInterpreter(iface)
+    lfi.interpret(Path('/a.launch'))
+    node = lfi.nodes[0]
+    assert node.remaps['/a'].get_value() == '/b'
+
+def test_group_env_does_not_leak():
+    iface = MockInterface({'/a.launch': '''<launch>
+        <env name="E" value="1"/>
+        <group><env name="E" value="2"/></group>
+        <node name="n" pkg="p" type="t"/>
+    </launch>'''})
+    lfi = LaunchInterpreter(iface)
+    lfi.interpret(Path('/a.launch'))
+    node = lfi.nodes[0]
+    assert node.environment['E'].get_value().value == '1'
+
+def test_deeply_nested_tree():
+    # deeper than the recursion limit; the XML parser itself recurses,
+    # so only the interpreter runs under the default limit
+    limit = sys.getrecursionlimit()
+    depth = limit + 100
+    xml = ('<launch>' + '<group>' * depth
+           + '<group ns="g"><include file="/c.launch"/></group>'
+           + '</group>' * depth + '</launch>')
+    sys.setrecursionlimit(limit * 4)
+    try:
+        tree = parse(xml)
+    finally:
+        sys.setrecursionlimit(limit)
+    iface = MockInterface({
+        '/a.launch': '<launch><include file="/b.launch" ns="x"/></launch>',
+        '/b.launch': tree,
+        '/c.launch': ('<launch>\n'
+                      '<node name="n" pkg="p" type="t"/>\n'
+                      '<include file="$(env F)"/>\n'
+                      '</launch>'),
+    })
+    lfi = LaunchInterpreter(iface)
+    try:
+        lfi.interpret(Path('/a.launch'))
+        assert False, 'expected a LaunchInterpreterError'
+    except LaunchInterpreterError as err:
+        assert (err.filepath, err.tag_name) == (Path('/c.launch'), 'include')
+        assert (err.line, err.column) == (3, 1)
+    assert [str(node.name) for node in lfi.nodes] == ['/x/g/n']
+
+def test_read_file_cache():
+    lfi = LaunchInterpreter(MockInterface({'/f.txt': 'text'}))
+    assert lfi._read_file('/f.txt', False) == 'text'
+    assert lfi._read_file('/f.txt', True) == b'text'
+    assert lfi._read_file('/f.txt', False) == 'text'
+    assert lfi._read_file('/f.txt', True) == b'text'
+    assert lfi.iface.reads == [('/f.txt', False), ('/f.txt', True)]
+
+def test_load_yaml_copies():
+    lfi = LaunchInterpreter(MockInterface({}))
+    text = 'a: [1, 2]\nb: {c: 3}\n'
+    first = lfi._load_yaml(text)
+    first['a'].append(4)
+    first['b']['c'] = 5
+    second = lfi._load_yaml(text)
+    assert second == {'a': [1, 2], 'b': {'c': 3}}
+
+def test_rosparam_file_loads_are_independent():
+    iface = MockInterface({
+        '/a.launch': '''<launch>
+            <rosparam command="load" file="/p.yaml" ns="x"/>
+            <rosparam command="load" file="/p.yaml" ns="y"/>
+        </launch>''',
+        '/p.yaml': 'a: [1, 2]\n',
+    })
+    lfi = LaunchInterpreter(iface)
+    lfi.interpret(Path('/a.launch'))
+    assert iface.reads == [('/p.yaml', False)]
+    x, y = lfi.parameters
+    assert (str(x.name), str(y.name)) == ('/x/a', '/y/a')
+    x.value.value.append(3)
+    assert y.value.value == [1, 2]
+
+def _interpret_error(xml):
+    lfi = LaunchInterpreter(MockInterface({'/a.launch': xml}))
+    try:
+        lfi.interpret(Path('/a.launch'))
+    except LaunchInterpreterError as err:
+        return err
+    assert False, 'expected a LaunchInterpreterError'
+
+def test_error_conditional_tag():
+    err = _interpret_error('<launch>\n'
+        '<rosparam command="delete" param="p" if="$(env X)"/>\n'
+        '</launch>')
+    assert isinstance(err.cause, SanityError)
+    assert (err.tag_name, err.line, err.column) == ('rosparam', 2, 1)
+    assert str(err.cause) == ('unable to resolve conditional <rosparam>: '
+                              'unknown $(env X)')
+    assert str(err) == 'in /a.launch <rosparam> [2:1]: ' + str(err.cause)
+
+def test_error_cannot_resolve():
+    err = _interpret_error('<launch><include file="$(env F)"/></launch>')
+    assert isinstance(err.cause, SanityError)
+    assert str(err.cause) == 'unable to resolve $(env F)'
+    assert str(err).endswith(']: unable to resolve $(env F)')
+
+def test_error_invalid_rosparam_command():
+    err = _interpret_error('<launch>\n'
+        '<rosparam command="bogus" param="p"/>\n'
+        '</launch>')
+    assert isinstance(err.cause, ValueError)
+    assert str(err.cause) == "'bogus' is not a valid value for 'command'"
+    assert (err.tag_name, err.line, err.column) == ('rosparam', 2, 1)
+
+def test_error_unknown_tag():
+    tag = parse('<launch><arg name="a"/></launch>').children[0]
+    assert str(SanityError.unknown_tag(tag)) == 'unknown tag: <arg>'
+
+def test_error_plain_messages():
+    assert str(SanityError('no {format}')) == 'no {format}'
+    assert str(LaunchInterpreterError('failed')) == 'failed'
+    assert str(LaunchInterpreterError(ValueError())) == 'ValueError'
+
+def test_error_pickle():
+    err = _interpret_error('<launch><include file="$(env F)"/></launch>')
+    copy = pickle.loads(pickle.dumps(err))
+    assert str(copy) == str(err)
+    assert str(copy.cause) == str(err.cause)
@@ -305,3 +305,19 @@ def test_parse_all_files():
             if fp.suffix == '.launch':
                 ast = parse_from_file(fp)
                 _test_valid_ast(ast)
+
+def test_literal_condition():
+    ast = parse('<launch>'
+                '<arg name="a"/>'
+                '<arg name="b" if="1"/>'
+                '<arg name="c" unless="true"/>'
+                '</launch>')
+    a, b, c = ast.children
+    assert a.resolve_if(None) is None
+    # literal values resolve once, regardless of scope
+    result = b.resolve_if(None)
+    assert result.is_resolved and result.value is True
+    assert b.resolve_if(None) is result
+    result = c.resolve_unless(None)
+    assert result.is_resolved and result.value is True
+    assert c.resolve_unless(None) is result
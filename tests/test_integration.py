@@ -587,3 +587,21 @@ def test_kobuki_minimal_safe_keyop():
         assert p.traceability.line in (6, 7, 13, 18, 29, 30, 31, 32, 33)
         assert p.traceability.column == 5
         assert p.value.value == params[p.name.full]
+
+
+###############################################################################
+# Test Parallel Interpretation
+###############################################################################
+
+def test_interpret_many_parallel():
+    fps = [Path(__file__).parent / 'launch' / 'kobuki_minimal.launch',
+           Path(__file__).parent / 'launch' / 'kobuki_safe_keyop.launch']
+    lfi = LaunchInterpreter(MockInterface(), include_absent=True)
+    lfi.interpret_many(fps)
+    other = LaunchInterpreter(MockInterface(), include_absent=True)
+    other.interpret_many(fps, processes=2)
+    assert ([n.name.full for n in other.nodes]
+            == [n.name.full for n in lfi.nodes])
+    assert ([p.name.full for p in other.parameters]
+            == [p.name.full for p in lfi.parameters])
+    assert other.rosparam_cmds == lfi.rosparam_cmds
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# SPDX-License-Identifier: MIT
+# Copyright © 2021 André Santos
+
+###############################################################################
+# Imports
+###############################################################################
+
+import os
+
+from haroslaunch.ros_iface import SimpleRosInterface
+
+###############################################################################
+# Tests
+###############################################################################
+
+def test_parse_tree_cache(tmp_path):
+    filepath = tmp_path / 'a.launch'
+    filepath.write_text(u'<launch><arg name="a"/></launch>')
+    os.utime(str(filepath), (1000, 1000))
+    iface = SimpleRosInterface()
+    tree = iface.request_parse_tree(filepath)
+    assert iface.request_parse_tree(filepath) is tree
+    assert iface.ast_cache[str(filepath)] is tree
+    # a modified file is parsed again
+    filepath.write_text(u'<launch><arg name="b"/></launch>')
+    os.utime(str(filepath), (2000, 2000))
+    new_tree = iface.request_parse_tree(filepath)
+    assert new_tree is not tree
+    assert new_tree.children[0].attributes['name'] == 'b'
+    assert iface.ast_cache[str(filepath)] is new_tree
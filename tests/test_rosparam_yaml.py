@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# SPDX-License-Identifier: MIT
+# Copyright © 2021 André Santos
+
+###############################################################################
+# Imports
+###############################################################################
+
+import math
+
+import pytest
+import yaml
+
+from haroslaunch.rosparam_yaml_monkey_patch import SafeLoader
+
+###############################################################################
+# Tests
+###############################################################################
+
+DOCUMENT = u'''
+deg: !degrees 180
+rad: !radians pi/2
+implicit_deg: deg(90)
+implicit_rad: rad(2*pi)
+binary: !!binary aGVsbG8=
+list: [deg(45), rad(pi)]
+'''
+
+def test_loaders_agree():
+    python_value = yaml.load(DOCUMENT, Loader=yaml.SafeLoader)
+    assert python_value['deg'] == math.pi
+    assert python_value['rad'] == math.pi / 2
+    assert python_value['implicit_deg'] == math.pi / 2
+    assert python_value['implicit_rad'] == 2 * math.pi
+    assert python_value['binary'].data == b'hello'
+    assert python_value['list'] == [math.pi / 4, math.pi]
+    if SafeLoader is yaml.SafeLoader:
+        pytest.skip('PyYAML was built without libyaml')
+    c_value = yaml.load(DOCUMENT, Loader=SafeLoader)
+    assert c_value == python_value